@@ -110,8 +110,6 @@ export default function Home() {
   };
 
   const renderMainContent = () => {
-    const currentBranch = getCurrentBranch();
-    
     // If a file is selected in files view, show appropriate layout based on screen size
     if (activeView === 'files' && selectedFile) {
       return (
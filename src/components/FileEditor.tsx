@@ -36,6 +36,31 @@ interface EditorTab {
   language: string;
 }
 
+// Monaco language ids keyed by file extension
+const languageMap: { [key: string]: string } = {
+  'js': 'javascript',
+  'jsx': 'javascript',
+  'ts': 'typescript',
+  'tsx': 'typescript',
+  'py': 'python',
+  'html': 'html',
+  'css': 'css',
+  'scss': 'scss',
+  'json': 'json',
+  'md': 'markdown',
+  'yml': 'yaml',
+  'yaml': 'yaml',
+  'xml': 'xml',
+  'sql': 'sql',
+  'sh': 'bash',
+  'php': 'php',
+  'java': 'java',
+  'cpp': 'cpp',
+  'c': 'c',
+  'rs': 'rust',
+  'go': 'go'
+};
+
 export default function FileEditor({ filePath, onClose, onSave }: FileEditorProps) {
   const { getCurrentBranch, updateBranchFiles } = useBranchStore();
   const [tabs, setTabs] = useState<EditorTab[]>([]);
@@ -54,29 +79,6 @@ export default function FileEditor({ filePath, onClose, onSave }: FileEditorProp
   // Language detection based on file extension
   const getLanguageFromPath = (path: string): string => {
     const extension = path.split('.').pop()?.toLowerCase();
-    const languageMap: { [key: string]: string } = {
-      'js': 'javascript',
-      'jsx': 'javascript',
-      'ts': 'typescript',
-      'tsx': 'typescript',
-      'py': 'python',
-      'html': 'html',
-      'css': 'css',
-      'scss': 'scss',
-      'json': 'json',
-      'md': 'markdown',
-      'yml': 'yaml',
-      'yaml': 'yaml',
-      'xml': 'xml',
-      'sql': 'sql',
-      'sh': 'bash',
-      'php': 'php',
-      'java': 'java',
-      'cpp': 'cpp',
-      'c': 'c',
-      'rs': 'rust',
-      'go': 'go'
-    };
     return languageMap[extension || ''] || 'text';
   };
 
@@ -13,6 +13,48 @@ interface Message extends BaseMessage {
   status?: 'analyzing' | 'generating' | 'completed' | 'error';
 }
 
+// Canned replies for the simulated assistant, checked in order against the lowercased input
+const cannedResponses: { keywords: string[]; response: string }[] = [
+  {
+    keywords: ['hello', 'hi'],
+    response: "Hello! I'm here to help you with your coding projects. What would you like to build?"
+  },
+  {
+    keywords: ['create', 'build', 'make'],
+    response: `I'd be happy to help you create that! Here's what I can do:
+
+## 🔧 Development Capabilities
+- Generate complete project structures
+- Create individual files with proper syntax
+- Fix bugs and optimize code
+- Explain complex concepts
+
+To get started, please provide more details about what you'd like to build. For example:
+- "Create a calculator app"
+- "Build a todo list with React"
+- "Make a simple landing page"
+
+The more specific you are, the better I can help!`
+  },
+  {
+    keywords: ['fix', 'error', 'bug'],
+    response: `I can help you fix that issue! Here's my approach:
+
+## 🔍 Debugging Process
+1. **Analyze** the error message and code context
+2. **Identify** the root cause
+3. **Provide** a clear solution with explanations
+4. **Test** to ensure the fix works
+
+Please share:
+- The error message you're seeing
+- The relevant code snippet
+- What you were trying to accomplish
+
+I'll help you get it working!`
+  }
+];
+
 export default function MainSection() {
   const { getCurrentBranch, updateBranchChat } = useBranchStore();
   const [messages, setMessages] = useState<Message[]>([]);
@@ -86,42 +128,11 @@ What would you like to build today?`,
     await new Promise(resolve => setTimeout(resolve, 1000 + Math.random() * 2000));
     
     // Simple responses based on input
-    if (userInput.toLowerCase().includes('hello') || userInput.toLowerCase().includes('hi')) {
-      return "Hello! I'm here to help you with your coding projects. What would you like to build?";
-    }
+    const input = userInput.toLowerCase();
     
-    if (userInput.toLowerCase().includes('create') || userInput.toLowerCase().includes('build') || userInput.toLowerCase().includes('make')) {
-      return `I'd be happy to help you create that! Here's what I can do:
-
-## 🔧 Development Capabilities
-- Generate complete project structures
-- Create individual files with proper syntax
-- Fix bugs and optimize code
-- Explain complex concepts
-
-To get started, please provide more details about what you'd like to build. For example:
-- "Create a calculator app"
-- "Build a todo list with React"
-- "Make a simple landing page"
-
-The more specific you are, the better I can help!`;
-    }
-    
-    if (userInput.toLowerCase().includes('fix') || userInput.toLowerCase().includes('error') || userInput.toLowerCase().includes('bug')) {
-      return `I can help you fix that issue! Here's my approach:
-
-## 🔍 Debugging Process
-1. **Analyze** the error message and code context
-2. **Identify** the root cause
-3. **Provide** a clear solution with explanations
-4. **Test** to ensure the fix works
-
-Please share:
-- The error message you're seeing
-- The relevant code snippet
-- What you were trying to accomplish
-
-I'll help you get it working!`;
+    const canned = cannedResponses.find(({ keywords }) => keywords.some(keyword => input.includes(keyword)));
+    if (canned) {
+      return canned.response;
     }
     
     return `I understand you want help with: "${userInput}"
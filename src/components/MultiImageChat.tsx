@@ -22,150 +22,134 @@ interface MultiImageChatProps {
   maxImages?: number;
 }
 
-export default function MultiImageChat({ onImagesAnalyzed, maxImages = 10 }: MultiImageChatProps) {
-  const [images, setImages] = useState<UploadedImage[]>([]);
-  const [dragOver, setDragOver] = useState(false);
-  const [isProcessing, setIsProcessing] = useState(false);
-  const fileInputRef = useRef<HTMLInputElement>(null);
-
-  // Upload to catbox.moe (free temporary hosting)
-  const uploadToCatbox = async (file: File): Promise<string> => {
-    const formData = new FormData();
-    formData.append('reqtype', 'fileupload');
-    formData.append('fileToUpload', file);
+// Cap in-flight upload + analysis work so a large batch doesn't flood the hosting and AI APIs
+const MAX_CONCURRENT_IMAGES = 3;
+
+async function runWithConcurrency<T>(items: T[], limit: number, worker: (item: T) => Promise<void>) {
+  let next = 0;
+  const runners = Array.from({ length: Math.min(limit, items.length) }, async () => {
+    while (next < items.length) {
+      await worker(items[next++]);
+    }
+  });
+  await Promise.all(runners);
+}
 
-    try {
-      const response = await fetch('https://catbox.moe/user/api.php', {
-        method: 'POST',
-        body: formData
-      });
+// Upload to catbox.moe (free temporary hosting)
+const uploadToCatbox = async (file: File): Promise<string> => {
+  const formData = new FormData();
+  formData.append('reqtype', 'fileupload');
+  formData.append('fileToUpload', file);
 
-      if (!response.ok) {
-        throw new Error('Catbox upload failed');
-      }
+  try {
+    const response = await fetch('https://catbox.moe/user/api.php', {
+      method: 'POST',
+      body: formData
+    });
 
-      const url = await response.text();
-      return url.trim();
-    } catch (error) {
-      console.error('Catbox upload failed:', error);
-      // Fallback to other services or local URL
-      return await uploadToImgBB(file);
+    if (!response.ok) {
+      throw new Error('Catbox upload failed');
     }
-  };
-
-  // Fallback to imgBB
-  const uploadToImgBB = async (file: File): Promise<string> => {
-    const formData = new FormData();
-    formData.append('image', file);
 
-    try {
-      // Using a demo API key - in production, use your own
-      const response = await fetch('https://api.imgbb.com/1/upload?key=demo', {
-        method: 'POST',
-        body: formData
-      });
-
-      if (response.ok) {
-        const data = await response.json();
-        return data.data.url;
-      }
-    } catch (error) {
-      console.error('ImgBB upload failed:', error);
+    const url = await response.text();
+    return url.trim();
+  } catch (error) {
+    console.error('Catbox upload failed:', error);
+    // Fallback to other services or local URL
+    return await uploadToImgBB(file);
+  }
+};
+
+// Fallback to imgBB
+const uploadToImgBB = async (file: File): Promise<string> => {
+  const formData = new FormData();
+  formData.append('image', file);
+
+  try {
+    // Using a demo API key - in production, use your own
+    const response = await fetch('https://api.imgbb.com/1/upload?key=demo', {
+      method: 'POST',
+      body: formData
+    });
+
+    if (response.ok) {
+      const data = await response.json();
+      return data.data.url;
+    }
+  } catch (error) {
+    console.error('ImgBB upload failed:', error);
+  }
+
+  // Final fallback to local URL
+  return URL.createObjectURL(file);
+};
+
+// Analyze image using AI
+const analyzeImage = async (imageUrl: string): Promise<string> => {
+  try {
+    const response = await fetch(process.env.NEXT_PUBLIC_POLLINATIONS_API_URL || 'https://text.pollinations.ai/openai', {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json',
+        'Referer': process.env.NEXT_PUBLIC_POLLINATIONS_REFERRER || '',
+        'token': process.env.NEXT_PUBLIC_POLLINATIONS_TOKEN || ''
+      },
+      body: JSON.stringify({
+        model: 'openai-large',
+        messages: [
+          {
+            role: 'system',
+            content: 'You are an expert image analyzer. Provide detailed analysis of images including content, style, technical details, and potential implementation ideas.'
+          },
+          {
+            role: 'user',
+            content: [
+              {
+                type: 'text',
+                text: 'Analyze this image in detail. Describe what you see, any UI elements, code patterns, design concepts, or technical implementations that could be built based on this image.'
+              },
+              {
+                type: 'image_url',
+                image_url: { url: imageUrl }
+              }
+            ]
+          }
+        ],
+        max_tokens: 1000
+      })
+    });
+
+    if (!response.ok) {
+      throw new Error(`Analysis failed: ${response.status}`);
     }
 
-    // Final fallback to local URL
-    return URL.createObjectURL(file);
-  };
-
-  // Analyze image using AI
-  const analyzeImage = async (imageUrl: string): Promise<string> => {
+    const responseText = await response.text();
+    
     try {
-      const response = await fetch(process.env.NEXT_PUBLIC_POLLINATIONS_API_URL || 'https://text.pollinations.ai/openai', {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-          'Referer': process.env.NEXT_PUBLIC_POLLINATIONS_REFERRER || '',
-          'token': process.env.NEXT_PUBLIC_POLLINATIONS_TOKEN || ''
-        },
-        body: JSON.stringify({
-          model: 'openai-large',
-          messages: [
-            {
-              role: 'system',
-              content: 'You are an expert image analyzer. Provide detailed analysis of images including content, style, technical details, and potential implementation ideas.'
-            },
-            {
-              role: 'user',
-              content: [
-                {
-                  type: 'text',
-                  text: 'Analyze this image in detail. Describe what you see, any UI elements, code patterns, design concepts, or technical implementations that could be built based on this image.'
-                },
-                {
-                  type: 'image_url',
-                  image_url: { url: imageUrl }
-                }
-              ]
-            }
-          ],
-          max_tokens: 1000
-        })
-      });
-
-      if (!response.ok) {
-        throw new Error(`Analysis failed: ${response.status}`);
-      }
-
-      const responseText = await response.text();
-      
-      try {
-        const jsonResponse = JSON.parse(responseText);
-        if (jsonResponse.choices?.[0]?.message?.content) {
-          return jsonResponse.choices[0].message.content;
-        }
-      } catch {
-        console.warn('Could not parse AI response as JSON, using raw text');
+      const jsonResponse = JSON.parse(responseText);
+      if (jsonResponse.choices?.[0]?.message?.content) {
+        return jsonResponse.choices[0].message.content;
       }
-
-      return responseText;
-    } catch (error) {
-      console.error('Image analysis failed:', error);
-      return `Analysis failed: ${error instanceof Error ? error.message : 'Unknown error'}`;
+    } catch {
+      console.warn('Could not parse AI response as JSON, using raw text');
     }
-  };
-
-  const handleFileSelect = useCallback(async (files: FileList | null) => {
-    if (!files || files.length === 0) return;
-
-    const newImages: UploadedImage[] = [];
-    const filesToProcess = Array.from(files).slice(0, maxImages - images.length);
-
-    for (const file of filesToProcess) {
-      if (!file.type.startsWith('image/')) continue;
-
-      const imageId = `${Date.now()}-${Math.random().toString(36).substr(2, 9)}`;
-      const newImage: UploadedImage = {
-        id: imageId,
-        file,
-        localUrl: URL.createObjectURL(file),
-        isAnalyzing: false,
-        isUploading: false,
-        name: file.name,
-        size: file.size
-      };
 
-      newImages.push(newImage);
-    }
+    return responseText;
+  } catch (error) {
+    console.error('Image analysis failed:', error);
+    return `Analysis failed: ${error instanceof Error ? error.message : 'Unknown error'}`;
+  }
+};
 
-    setImages(prev => [...prev, ...newImages]);
+export default function MultiImageChat({ onImagesAnalyzed, maxImages = 10 }: MultiImageChatProps) {
+  const [images, setImages] = useState<UploadedImage[]>([]);
+  const [dragOver, setDragOver] = useState(false);
+  const [isProcessing, setIsProcessing] = useState(false);
+  const fileInputRef = useRef<HTMLInputElement>(null);
 
-    // Process each image
-    for (const image of newImages) {
-      processImage(image.id);
-    }
-  }, [images.length, maxImages, processImage]);
+  const processImage = useCallback(async (image: UploadedImage) => {
+    const imageId = image.id;
 
-  const processImage = useCallback(async (imageId: string) => {
     setImages(prev => prev.map(img => 
       img.id === imageId 
         ? { ...img, isUploading: true }
@@ -173,9 +157,6 @@ export default function MultiImageChat({ onImagesAnalyzed, maxImages = 10 }: Mul
     ));
 
     try {
-      const image = images.find(img => img.id === imageId);
-      if (!image) return;
-
       // Upload to hosting service
       const hostedUrl = await uploadToCatbox(image.file);
       
@@ -202,7 +183,36 @@ export default function MultiImageChat({ onImagesAnalyzed, maxImages = 10 }: Mul
           : img
       ));
     }
-  }, [images, uploadToCatbox, analyzeImage]);
+  }, []);
+
+  const handleFileSelect = useCallback(async (files: FileList | null) => {
+    if (!files || files.length === 0) return;
+
+    const newImages: UploadedImage[] = [];
+    const filesToProcess = Array.from(files).slice(0, maxImages - images.length);
+
+    for (const file of filesToProcess) {
+      if (!file.type.startsWith('image/')) continue;
+
+      const imageId = `${Date.now()}-${Math.random().toString(36).substr(2, 9)}`;
+      const newImage: UploadedImage = {
+        id: imageId,
+        file,
+        localUrl: URL.createObjectURL(file),
+        isAnalyzing: false,
+        isUploading: false,
+        name: file.name,
+        size: file.size
+      };
+
+      newImages.push(newImage);
+    }
+
+    setImages(prev => [...prev, ...newImages]);
+
+    // Process new images concurrently, a few at a time
+    await runWithConcurrency(newImages, MAX_CONCURRENT_IMAGES, processImage);
+  }, [images.length, maxImages, processImage]);
 
   const removeImage = (imageId: string) => {
     const image = images.find(img => img.id === imageId);
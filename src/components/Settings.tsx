@@ -45,18 +45,15 @@ const defaultSettings: SettingsData = {
   soundEnabled: true
 };
 
+// Available models come from build-time env vars, so parse them once per module
+const availableModels = (
+  process.env.NEXT_PUBLIC_AI_MODELS || 'openai,openai-fast,openai-large,qwen-coder,llama,mistral,deepseek-reasoning,grok,searchgpt'
+).split(',').map(model => model.trim());
+
 export default function Settings() {
   const [settings, setSettings] = useState<SettingsData>(defaultSettings);
   const [hasUnsavedChanges, setHasUnsavedChanges] = useState(false);
 
-  // Get available models from environment variables
-  const getAvailableModels = () => {
-    const modelsString = process.env.NEXT_PUBLIC_AI_MODELS || 'openai,openai-fast,openai-large,qwen-coder,llama,mistral,deepseek-reasoning,grok,searchgpt';
-    return modelsString.split(',').map(model => model.trim());
-  };
-
-  const availableModels = getAvailableModels();
-
   useEffect(() => {
     // Load settings from localStorage
     const savedSettings = localStorage.getItem('coder-settings');
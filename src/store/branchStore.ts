@@ -1,5 +1,5 @@
 import { create } from 'zustand';
-import { persist } from 'zustand/middleware';
+import { persist, type PersistStorage, type StorageValue } from 'zustand/middleware';
 
 interface FileNode {
   name: string;
@@ -51,6 +51,54 @@ export interface BranchState {
   getBranch: (branchId: string) => Branch | null;
 }
 
+// Coalesce bursts of branch updates (chat autosave, file edits) into a single
+// localStorage write instead of re-serializing every branch on each change
+const PERSIST_DEBOUNCE_MS = 500;
+
+function createDebouncedStorage<S>(): PersistStorage<S> | undefined {
+  if (typeof window === 'undefined') return undefined;
+
+  const pending = new Map<string, StorageValue<S>>();
+  let timer: ReturnType<typeof setTimeout> | null = null;
+
+  const flush = () => {
+    if (timer) {
+      clearTimeout(timer);
+      timer = null;
+    }
+    pending.forEach((value, name) => {
+      localStorage.setItem(name, JSON.stringify(value));
+    });
+    pending.clear();
+  };
+
+  // Make sure the last burst is written before the tab goes away
+  window.addEventListener('pagehide', flush);
+  document.addEventListener('visibilitychange', () => {
+    if (document.visibilityState === 'hidden') flush();
+  });
+
+  return {
+    getItem: (name) => {
+      const pendingValue = pending.get(name);
+      if (pendingValue) return pendingValue;
+
+      const stored = localStorage.getItem(name);
+      return stored ? JSON.parse(stored) : null;
+    },
+    setItem: (name, value) => {
+      pending.set(name, value);
+      if (!timer) {
+        timer = setTimeout(flush, PERSIST_DEBOUNCE_MS);
+      }
+    },
+    removeItem: (name) => {
+      pending.delete(name);
+      localStorage.removeItem(name);
+    }
+  };
+}
+
 export const useBranchStore = create<BranchState>()(
   persist(
     (set, get) => ({
@@ -195,7 +243,8 @@ export const useBranchStore = create<BranchState>()(
     }),
     {
       name: 'branch-storage',
-      version: 1
+      version: 1,
+      storage: createDebouncedStorage<BranchState>()
     }
   )
 );
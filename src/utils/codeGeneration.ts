@@ -82,25 +82,34 @@ export function parseAIResponse(content: string): CodeBlock[] {
 }
 
 export function detectProjectStructure(codeBlocks: CodeBlock[]): ProjectStructure {
-  const hasReact = codeBlocks.some(block => 
-    block.content.includes('import React') || 
-    block.filename.endsWith('.jsx') || 
-    block.filename.endsWith('.tsx')
-  );
+  let hasReact = false;
+  let hasHTML = false;
+  let hasPython = false;
+  let packageJsonBlock: CodeBlock | undefined;
   
-  const hasHTML = codeBlocks.some(block => 
-    block.filename.endsWith('.html') || 
-    block.content.includes('<!DOCTYPE html>')
-  );
-  
-  const hasPython = codeBlocks.some(block => 
-    block.filename.endsWith('.py') || 
-    block.language === 'python'
-  );
+  // Classify every block in a single pass
+  for (const block of codeBlocks) {
+    const { filename, content } = block;
+    
+    if (!hasReact) {
+      hasReact = content.includes('import React') || 
+        filename.endsWith('.jsx') || 
+        filename.endsWith('.tsx');
+    }
+    if (!hasHTML) {
+      hasHTML = filename.endsWith('.html') || 
+        content.includes('<!DOCTYPE html>');
+    }
+    if (!hasPython) {
+      hasPython = filename.endsWith('.py') || 
+        block.language === 'python';
+    }
+    if (!packageJsonBlock && filename === 'package.json') {
+      packageJsonBlock = block;
+    }
+  }
   
-  const hasPackageJson = codeBlocks.some(block => 
-    block.filename === 'package.json'
-  );
+  const hasPackageJson = packageJsonBlock !== undefined;
   
   let type: ProjectStructure['type'] = 'general';
   let name = 'generated-project';
@@ -121,7 +130,6 @@ export function detectProjectStructure(codeBlocks: CodeBlock[]): ProjectStructur
   
   // Extract dependencies from package.json if it exists
   const dependencies: string[] = [];
-  const packageJsonBlock = codeBlocks.find(block => block.filename === 'package.json');
   if (packageJsonBlock) {
     try {
       const packageData = JSON.parse(packageJsonBlock.content);
@@ -144,14 +152,14 @@ export function detectProjectStructure(codeBlocks: CodeBlock[]): ProjectStructur
   };
 }
 
+// Common comment patterns that indicate a filename (non-global, so safe to share)
+const filenamePatterns = [
+  /\/\/\s*(@filename|filename|file):\s*(.+)/i,
+  /\/\*\s*(@filename|filename|file):\s*(.+)\s*\*\//i,
+  /#\s*(@filename|filename|file):\s*(.+)/i,
+];
+
 function detectFilenameFromContent(content: string, language: string): string | null {
-  // Look for common patterns that indicate filename
-  const filenamePatterns = [
-    /\/\/\s*(@filename|filename|file):\s*(.+)/i,
-    /\/\*\s*(@filename|filename|file):\s*(.+)\s*\*\//i,
-    /#\s*(@filename|filename|file):\s*(.+)/i,
-  ];
-  
   for (const pattern of filenamePatterns) {
     const match = content.match(pattern);
     if (match && match[2]) {
@@ -187,36 +195,36 @@ function detectFilenameFromContent(content: string, language: string): string |
   return null;
 }
 
+const extensionMap: { [key: string]: string } = {
+  'javascript': 'js',
+  'js': 'js',
+  'jsx': 'jsx',
+  'typescript': 'ts',
+  'ts': 'ts',
+  'tsx': 'tsx',
+  'python': 'py',
+  'py': 'py',
+  'html': 'html',
+  'css': 'css',
+  'scss': 'scss',
+  'json': 'json',
+  'markdown': 'md',
+  'md': 'md',
+  'java': 'java',
+  'cpp': 'cpp',
+  'c': 'c',
+  'rust': 'rs',
+  'go': 'go',
+  'php': 'php',
+  'ruby': 'rb',
+  'shell': 'sh',
+  'bash': 'sh',
+  'sql': 'sql',
+  'yaml': 'yml',
+  'xml': 'xml'
+};
+
 function getExtensionFromLanguage(language: string): string {
-  const extensionMap: { [key: string]: string } = {
-    'javascript': 'js',
-    'js': 'js',
-    'jsx': 'jsx',
-    'typescript': 'ts',
-    'ts': 'ts',
-    'tsx': 'tsx',
-    'python': 'py',
-    'py': 'py',
-    'html': 'html',
-    'css': 'css',
-    'scss': 'scss',
-    'json': 'json',
-    'markdown': 'md',
-    'md': 'md',
-    'java': 'java',
-    'cpp': 'cpp',
-    'c': 'c',
-    'rust': 'rs',
-    'go': 'go',
-    'php': 'php',
-    'ruby': 'rb',
-    'shell': 'sh',
-    'bash': 'sh',
-    'sql': 'sql',
-    'yaml': 'yml',
-    'xml': 'xml'
-  };
-  
   return extensionMap[language.toLowerCase()] || 'txt';
 }
 interface ProjectNode {